@@ -0,0 +1,156 @@
+# customer_health.py
+#
+# Derived health signals for the whole customer base, computed column-wise with
+# pandas so the Customer Health and Proactive Outreach pages only read results.
+# health_score and churn_risk are computed here by score_health(); the values
+# stored on the CRM record are kept as crm_health_score / crm_churn_risk for
+# comparison.
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+AT_RISK = ["HIGH", "CRITICAL"]
+RENEWAL_RISK_DAYS = 45
+
+# Component weights for health_score; they sum to 1
+SCORE_WEIGHTS = {"usage": 0.40, "adoption": 0.20, "support": 0.25, "renewal": 0.15}
+# Renewals further out than this add no risk
+RENEWAL_HORIZON_DAYS = 90
+# Lowest health_score in each churn_risk band, best band first
+RISK_BANDS = [(75, "LOW"), (55, "MEDIUM"), (35, "HIGH"), (0, "CRITICAL")]
+
+# Support columns replaced by live ticket counts -> support_stats_by_customer() key
+LIVE_SUPPORT_COLUMNS = {
+    "open_tickets": "open_tickets",
+    "resolved_this_month": "solved",
+    "ai_resolved": "ai_resolved",
+    "escalated": "escalated",
+}
+
+
+def compute_health_signals(customers, today=None):
+    """One row per customer id with usage, support, renewal and alert columns."""
+    customers = list(customers)
+    today = today or datetime.now()
+
+    df = pd.DataFrame({
+        "id": [c["id"] for c in customers],
+        "crm_health_score": [c["health_score"] for c in customers],
+        "crm_churn_risk": [c["churn_risk"] for c in customers],
+        "renewal_date": [c["renewal_date"] for c in customers],
+        "last_7_days": [c["usage"]["last_7_days"] for c in customers],
+        "avg_weekly": [c["usage"]["avg_weekly"] for c in customers],
+        "trend": [c["usage"]["trend"] for c in customers],
+        "features_adopted": [len(c["features"]["adopted"]) for c in customers],
+        "features_not_adopted": [len(c["features"]["not_adopted"]) for c in customers],
+        "open_tickets": [c["support"]["open_tickets"] for c in customers],
+        "resolved_this_month": [c["support"]["resolved_this_month"] for c in customers],
+        "ai_resolved": [c["support"]["ai_resolved"] for c in customers],
+        "escalated": [c["support"]["escalated"] for c in customers],
+    }).set_index("id")
+    df["live_support"] = False
+
+    avg_weekly = df["avg_weekly"].astype(float)
+
+    df["usage_change"] = df["last_7_days"] - df["avg_weekly"]
+    df["usage_drop_pct"] = np.where(
+        avg_weekly > 0, (avg_weekly - df["last_7_days"]) / avg_weekly.where(avg_weekly > 0, 1) * 100, 0.0
+    )
+    df["features_total"] = df["features_adopted"] + df["features_not_adopted"]
+    df["ai_resolution_rate"] = _ai_resolution_rate(df)
+    df["days_to_renewal"] = (pd.to_datetime(df["renewal_date"], format="%Y-%m-%d") - pd.Timestamp(today)).dt.days
+    df[["health_score", "churn_risk"]] = score_health(df)
+
+    # Alert flags shown on Customer Health and used to pick outreach drafts
+    df["usage_drop_alert"] = df["trend"] == "DOWN"
+    df["renewal_risk"] = _renewal_risk(df)
+    df["adoption_gap"] = df["features_not_adopted"] > 0
+    return df
+
+
+def score_health(df):
+    """health_score (0-100) and churn_risk for every row of a signals frame.
+
+    Each component is scored 0-100 and combined with SCORE_WEIGHTS:
+
+    - usage: last 7 days as a share of the weekly average, capped at 100%
+    - adoption: share of available features the customer has adopted
+    - support: mean of the AI resolution rate (capped at 100%) and the share
+      of tickets not escalated (open + resolved this month); 100 when there are no tickets
+    - renewal: days to renewal as a share of RENEWAL_HORIZON_DAYS, 0 when due
+
+    churn_risk is the RISK_BANDS band the rounded score falls in.
+    """
+    avg_weekly = df["avg_weekly"].astype(float)
+    usage = np.where(avg_weekly > 0, (df["last_7_days"] / avg_weekly.where(avg_weekly > 0, 1)).clip(upper=1), 1.0)
+
+    features_total = df["features_total"].astype(float)
+    adoption = np.where(features_total > 0, df["features_adopted"] / features_total.where(features_total > 0, 1), 1.0)
+
+    tickets = (df["open_tickets"] + df["resolved_this_month"]).astype(float)
+    not_escalated = 1 - (df["escalated"] / tickets.where(tickets > 0, 1)).clip(upper=1)
+    ai_resolved = (df["ai_resolution_rate"] / 100).clip(upper=1)
+    support = np.where(tickets > 0, (ai_resolved + not_escalated) / 2, 1.0)
+
+    renewal = (df["days_to_renewal"] / RENEWAL_HORIZON_DAYS).clip(lower=0, upper=1)
+
+    score = (
+        SCORE_WEIGHTS["usage"] * usage
+        + SCORE_WEIGHTS["adoption"] * adoption
+        + SCORE_WEIGHTS["support"] * support
+        + SCORE_WEIGHTS["renewal"] * renewal
+    ) * 100
+    score = np.rint(score).astype(int)
+    churn_risk = np.select([score >= floor for floor, _ in RISK_BANDS[:-1]], [band for _, band in RISK_BANDS[:-1]],
+                           RISK_BANDS[-1][1])
+    return pd.DataFrame({"health_score": score, "churn_risk": churn_risk}, index=df.index)
+
+
+def apply_live_support(signals, live_stats):
+    """Overlay live ticket counts (from support_stats_by_customer) onto the signals.
+
+    Only customers that have tickets in the store are touched; their support
+    columns, AI resolution rate and scores are recomputed, everything else is
+    reused.
+    """
+    ids = [cid for cid in live_stats if cid in signals.index]
+    if not ids:
+        return signals
+
+    signals = signals.copy()
+    live = pd.DataFrame.from_dict({cid: live_stats[cid] for cid in ids}, orient="index")
+    for column, key in LIVE_SUPPORT_COLUMNS.items():
+        signals.loc[ids, column] = live[key]
+    signals.loc[ids, "live_support"] = True
+    signals.loc[ids, "ai_resolution_rate"] = _ai_resolution_rate(signals.loc[ids])
+    signals.loc[ids, ["health_score", "churn_risk"]] = score_health(signals.loc[ids])
+    signals.loc[ids, "renewal_risk"] = _renewal_risk(signals.loc[ids])
+    return signals
+
+
+def customer_signals(signals, customer_id, live=None):
+    """One customer's signals row, with their live support stats (if any) overlaid.
+
+    Only that row is copied, so a page showing a single customer never pays
+    for the whole table.
+    """
+    row = signals.loc[[customer_id]]
+    if live is not None:
+        for column, key in LIVE_SUPPORT_COLUMNS.items():
+            row[column] = live[key]
+        row["live_support"] = True
+        row["ai_resolution_rate"] = _ai_resolution_rate(row)
+        row[["health_score", "churn_risk"]] = score_health(row)
+        row["renewal_risk"] = _renewal_risk(row)
+    return row.iloc[0]
+
+
+def _renewal_risk(df):
+    return (df["days_to_renewal"] < RENEWAL_RISK_DAYS) & df["churn_risk"].isin(AT_RISK)
+
+
+def _ai_resolution_rate(df):
+    resolved = df["resolved_this_month"].astype(float)
+    return np.where(resolved > 0, df["ai_resolved"] / resolved.where(resolved > 0, 1) * 100, 0.0)
@@ -0,0 +1,104 @@
+# customer_repository.py
+#
+# Indexed access to the customer book of business. Records stay in the same
+# nested-dict shape as src.data.synthetic_customers.CUSTOMERS; the repository
+# only adds lookup tables on top of them.
+
+import json
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Free/consumer mail providers never identify a single account
+PUBLIC_EMAIL_DOMAINS = frozenset({
+    "gmail.com", "googlemail.com", "yahoo.com", "hotmail.com", "outlook.com", "live.com",
+    "msn.com", "icloud.com", "me.com", "mac.com", "aol.com", "proton.me", "protonmail.com",
+    "gmx.com", "mail.com", "yandex.com", "zoho.com",
+})
+
+
+class CustomerRepository:
+    """Customers indexed by id, name, email, churn risk and renewal date.
+
+    Corporate domains come from a customer's optional "domains" list, or else
+    from its contact email; public mail domains and domains claimed by more
+    than one customer are never indexed.
+    """
+
+    def __init__(self, customers):
+        self._customers = list(customers)
+        self._by_id = {}
+        self._by_name = {}
+        self._by_email = {}
+        self._by_domain = {}
+        self._by_risk = {}
+
+        renewals = []
+        for pos, customer in enumerate(self._customers):
+            self._by_id[customer["id"]] = pos
+            self._by_name[customer["name"]] = pos
+            self._by_email[customer["contact_email"].lower()] = pos
+            for domain in customer.get("domains") or [customer["contact_email"].rsplit("@", 1)[-1]]:
+                domain = domain.lower()
+                if domain in PUBLIC_EMAIL_DOMAINS:
+                    continue
+                # A domain claimed by several customers can't identify one
+                self._by_domain[domain] = pos if self._by_domain.get(domain, pos) == pos else None
+            self._by_risk.setdefault(customer["churn_risk"], []).append(pos)
+            renewals.append((customer["renewal_date"], pos))
+
+        # ISO dates sort lexically, so the renewal index is a plain sorted list
+        renewals.sort()
+        self._renewal_dates = [d for d, _ in renewals]
+        self._renewal_positions = [pos for _, pos in renewals]
+
+    @classmethod
+    def from_file(cls, path):
+        """Load customers from a JSON file holding a list of customer dicts."""
+        with open(Path(path), "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def __len__(self):
+        return len(self._customers)
+
+    def __iter__(self):
+        return iter(self._customers)
+
+    def names(self):
+        return [c["name"] for c in self._customers]
+
+    def get(self, customer_id):
+        pos = self._by_id.get(customer_id)
+        return None if pos is None else self._customers[pos]
+
+    def by_name(self, name):
+        pos = self._by_name.get(name)
+        return None if pos is None else self._customers[pos]
+
+    def by_email(self, email):
+        pos = self._by_email.get(email.lower())
+        return None if pos is None else self._customers[pos]
+
+    def match_email(self, email):
+        """Customer owning an email: exact contact match first, then by corporate domain."""
+        email = email.lower()
+        pos = self._by_email.get(email)
+        if pos is None:
+            pos = self._by_domain.get(email.rsplit("@", 1)[-1])
+        return None if pos is None else self._customers[pos]
+
+    def with_churn_risk(self, *risks):
+        """Customers with any of the given churn risks, in original order."""
+        positions = sorted(pos for risk in risks for pos in self._by_risk.get(risk, []))
+        return [self._customers[pos] for pos in positions]
+
+    def renewing_between(self, start, end):
+        """Customers whose renewal_date falls in [start, end], soonest first."""
+        lo = bisect_left(self._renewal_dates, start.strftime("%Y-%m-%d"))
+        hi = bisect_right(self._renewal_dates, end.strftime("%Y-%m-%d"))
+        return [self._customers[pos] for pos in self._renewal_positions[lo:hi]]
+
+    def renewing_within(self, days, today=None):
+        """Customers renewing in the next `days` days, soonest first."""
+        today = today or datetime.now()
+        return self.renewing_between(today, today + timedelta(days=days))
@@ -0,0 +1,150 @@
+# dashboard_data.py
+#
+# Data preparation for the TAM dashboard pages. Kept free of Streamlit so the
+# same code can be timed by test_performance.py.
+
+from collections import defaultdict
+
+
+def summarize_tickets(tickets):
+    """Count open, solved and escalated tickets in one pass."""
+    summary = {"total": len(tickets), "open": 0, "solved": 0, "escalated": 0}
+    for t in tickets:
+        if t["status"] == "open":
+            summary["open"] += 1
+        elif t["status"] == "solved":
+            summary["solved"] += 1
+        if t["ai_analysis"]["escalated"]:
+            summary["escalated"] += 1
+    return summary
+
+
+def filter_tickets(tickets, status="All", priority="All", device="All"):
+    """Apply the Support Tickets filters in one pass, most recent first."""
+    return [
+        t for t in reversed(tickets)
+        if (status == "All" or t["status"] == status)
+        and (priority == "All" or t["priority"] == priority)
+        and (device == "All" or t["device_type"] == device)
+    ]
+
+
+def aggregate_tickets(tickets):
+    """Everything the Analytics page plots, from a single pass over the tickets."""
+    stats = {
+        "total": len(tickets),
+        "open": 0,
+        "solved": 0,
+        "ai_resolved": 0,
+        "escalated": 0,
+        "confidence_sum": 0,
+        "confidences": [],
+        "tickets_by_date": defaultdict(lambda: {"total": 0, "ai_solved": 0}),
+        "response_by_date": defaultdict(list),
+        "stage_timings": defaultdict(list),
+        "priority_counts": {"urgent": 0, "high": 0, "medium": 0, "low": 0},
+        "device_counts": {},
+    }
+    tickets_by_date = stats["tickets_by_date"]
+    priority_counts = stats["priority_counts"]
+    device_counts = stats["device_counts"]
+
+    for ticket in tickets:
+        analysis = ticket.get("ai_analysis", {})
+        date = ticket["created_at"][:10]  # Get just the date
+        is_escalated = analysis["escalated"]
+
+        if ticket["status"] == "open":
+            stats["open"] += 1
+        elif ticket["status"] == "solved":
+            stats["solved"] += 1
+        if is_escalated:
+            stats["escalated"] += 1
+
+        tickets_by_date[date]["total"] += 1
+        if ticket["status"] == "solved" and not is_escalated:
+            stats["ai_resolved"] += 1
+            tickets_by_date[date]["ai_solved"] += 1
+
+        confidence = analysis.get("confidence", 0)
+        stats["confidence_sum"] += confidence
+        if confidence:
+            stats["confidences"].append(confidence)
+
+        # Per-stage timings are recorded on the ticket by the request pipeline;
+        # tickets created before that have none and are left out of the latency stats
+        timings = analysis.get("timings")
+        if timings:
+            stats["response_by_date"][date].append(sum(timings.values()))
+            for stage, ms in timings.items():
+                stats["stage_timings"][stage].append(ms)
+
+        priority = ticket.get("priority", "medium")
+        priority_counts[priority] = priority_counts.get(priority, 0) + 1
+
+        device = ticket.get("device_type", "Unknown")
+        device_counts[device] = device_counts.get(device, 0) + 1
+
+    return stats
+
+
+def summarize_notifications(notifications):
+    """Total, unread and per-channel counts from one pass over the notifications.
+
+    Replaces separate get_unread_notifications() calls, which re-read the store.
+    """
+    summary = {"total": len(notifications), "unread": 0, "by_channel": {}, "unread_by_channel": {}}
+    by_channel = summary["by_channel"]
+    unread_by_channel = summary["unread_by_channel"]
+    for notif in notifications:
+        channel = notif.get("channel", "Unknown")
+        by_channel[channel] = by_channel.get(channel, 0) + 1
+        if not notif.get("read"):
+            summary["unread"] += 1
+            unread_by_channel[channel] = unread_by_channel.get(channel, 0) + 1
+    return summary
+
+
+def store_version(records):
+    """Cheap change marker for a store: record count plus the newest updated_at (or created_at)."""
+    return len(records), max((r.get("updated_at") or r["created_at"] for r in records), default=None)
+
+
+def support_stats_by_customer(tickets, customers):
+    """Join tickets to customers and roll up live support stats.
+
+    A ticket's explicit customer_id wins when it names a known customer;
+    otherwise the requester email is matched by CustomerRepository.match_email().
+    Returns customer id -> ticket ids and open/solved/AI-resolved/escalated
+    counts. Tickets from unknown requesters are skipped.
+    """
+    stats = {}
+    owner_by_email = {}
+    for ticket in tickets:
+        customer_id = ticket.get("customer_id")
+        if customer_id is None or customers.get(customer_id) is None:
+            email = ticket["requester"]["email"]
+            if email not in owner_by_email:
+                customer = customers.match_email(email)
+                owner_by_email[email] = customer["id"] if customer else None
+            customer_id = owner_by_email[email]
+        if customer_id is None:
+            continue
+
+        entry = stats.get(customer_id)
+        if entry is None:
+            entry = stats[customer_id] = {
+                "ticket_ids": [], "open_tickets": 0, "solved": 0, "ai_resolved": 0, "escalated": 0,
+            }
+        entry["ticket_ids"].append(ticket["id"])
+        escalated = ticket["ai_analysis"]["escalated"]
+        if ticket["status"] == "open":
+            entry["open_tickets"] += 1
+        elif ticket["status"] == "solved":
+            entry["solved"] += 1
+            if not escalated:
+                entry["ai_resolved"] += 1
+        if escalated:
+            entry["escalated"] += 1
+    return stats
+
@@ -0,0 +1,100 @@
+# instrumentation.py
+#
+# Latency spans and histograms. Stages timed with span() are aggregated per
+# process and can be exported as Prometheus text. Support requests
+# carry their own per-stage timings on the ticket, as
+# ai_analysis["timings"] = {stage: milliseconds}, which the Analytics page
+# summarizes with stage_percentiles().
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of a non-empty list (q in 0-100)."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))  # ceil without floats
+    return ordered[int(rank) - 1]
+
+
+def stage_percentiles(samples_by_stage):
+    """stage -> {"count", "p50", "p95"} for each stage with samples."""
+    return {
+        stage: {"count": len(samples), "p50": percentile(samples, 50), "p95": percentile(samples, 95)}
+        for stage, samples in samples_by_stage.items()
+        if samples
+    }
+
+
+class LatencyHistogram:
+    """Cumulative bucket counts plus a window of recent samples for percentiles."""
+
+    def __init__(self, buckets=BUCKETS_MS, window=1000):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, ms):
+        for i, bound in enumerate(self.buckets):
+            if ms <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.sum += ms
+        self.recent.append(ms)
+
+
+class Registry:
+    """Process-wide set of named latency histograms."""
+
+    def __init__(self):
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage, ms):
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = LatencyHistogram()
+            histogram.observe(ms)
+
+    @contextmanager
+    def span(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, (time.perf_counter() - start) * 1000)
+
+    def summary(self):
+        with self._lock:
+            samples = {stage: list(h.recent) for stage, h in self._histograms.items()}
+        return stage_percentiles(samples)
+
+    def to_prometheus(self, metric="flowsupport_stage_latency_ms"):
+        lines = [f"# HELP {metric} Stage latency in milliseconds", f"# TYPE {metric} histogram"]
+        with self._lock:
+            for stage, h in sorted(self._histograms.items()):
+                cumulative = 0
+                for bound, count in zip(self.bucket_labels(h), h.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{stage="{stage}"}} {h.sum:.3f}')
+                lines.append(f'{metric}_count{{stage="{stage}"}} {h.count}')
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def bucket_labels(histogram):
+        return [str(b) for b in histogram.buckets] + ["+Inf"]
+
+
+REGISTRY = Registry()
+span = REGISTRY.span
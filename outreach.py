@@ -0,0 +1,161 @@
+# outreach.py
+#
+# Draft emails for the Proactive Outreach queue. Drafts are built for the whole
+# at-risk cohort in one batch and cached per customer under a hash of the
+# inputs they were rendered from, so a rebuild only re-renders what changed.
+# The dashboard runs build_queue() once per ticket-store version and every
+# rerun in between only displays its result.
+
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from customer_health import AT_RISK
+
+USAGE_DROP = "usage_drop"
+RENEWAL_RISK = "renewal_risk"
+FEATURE_ADOPTION = "feature_adoption"
+
+# Health signal columns the triggers and templates read
+SIGNAL_COLUMNS = ["usage_drop_alert", "usage_drop_pct", "renewal_risk", "days_to_renewal", "adoption_gap"]
+# Health signal columns the page shows next to each draft
+CONTEXT_COLUMNS = ["health_score", "churn_risk", "days_to_renewal", "open_tickets"]
+
+TEMPLATES = {
+    USAGE_DROP: """**To:** {contact_email}  
+**Subject:** Quick check-in on {name}'s Flow usage
+
+Hi {first_name},
+
+I noticed your team's Flow usage dropped {drop_pct:.0f}% this week (from {avg_weekly}h to {last_7_days}h).
+
+Is everything okay? Common reasons for drops:
+- Team members out on holiday
+- Technical issues we should address  
+- Workflow changes we could help optimize
+
+Happy to hop on a quick 15-min call to make sure you're getting the most value from Flow.
+
+Best,
+[Your TAM Name]""",
+    RENEWAL_RISK: """**To:** {contact_email}  
+**Subject:** Planning ahead for {name}'s Flow renewal
+
+Hi {first_name},
+
+Your Flow renewal is coming up in {days_to_renewal} days, and I'd like to make sure the next term is set up around what your team actually needs.
+
+Could we grab 30 minutes to go over:
+- How the team is using Flow today
+- Anything that's been getting in the way
+- Goals for the coming year
+
+Let me know a time that works and I'll send an invite.
+
+Best,
+[Your TAM Name]""",
+    FEATURE_ADOPTION: """**To:** {contact_email}  
+**Subject:** Getting more out of Flow at {name}
+
+Hi {first_name},
+
+I noticed your team hasn't tried {not_adopted} yet. Teams that pick these up usually save a lot of time on day-to-day writing.
+
+Happy to run a quick 15-min demo for you or anyone on the team.
+
+Best,
+[Your TAM Name]""",
+}
+
+
+def pick_trigger(signals):
+    """The most pressing outreach reason for a customer, or None."""
+    if signals["usage_drop_alert"]:
+        return USAGE_DROP
+    if signals["renewal_risk"] and signals["days_to_renewal"] >= 0:
+        return RENEWAL_RISK
+    if signals["adoption_gap"]:
+        return FEATURE_ADOPTION
+    return None
+
+
+def draft_inputs(customer, signals, trigger):
+    """Only the values the chosen template reads, so unrelated changes don't invalidate a draft."""
+    inputs = {
+        "trigger": trigger,
+        "contact_email": customer["contact_email"],
+        "name": customer["name"],
+        "first_name": customer["contact_name"].split()[0],
+    }
+    if trigger == USAGE_DROP:
+        inputs.update(
+            drop_pct=round(float(signals["usage_drop_pct"]), 2),
+            avg_weekly=customer["usage"]["avg_weekly"],
+            last_7_days=customer["usage"]["last_7_days"],
+        )
+    elif trigger == RENEWAL_RISK:
+        inputs["days_to_renewal"] = int(signals["days_to_renewal"])
+    elif trigger == FEATURE_ADOPTION:
+        inputs["not_adopted"] = ", ".join(customer["features"]["not_adopted"])
+    return inputs
+
+
+def inputs_hash(inputs):
+    return hashlib.sha1(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def generate_drafts(cohort, health_signals, cache, personalize=None, max_workers=4):
+    """Return customer id -> draft for every customer in the cohort with a trigger.
+
+    `cache` maps customer id -> draft and is updated in place; a draft is only
+    re-rendered when its input hash changes, and entries for customers that no
+    longer get a draft are dropped. `personalize(text, inputs)` is an
+    optional callable (e.g. an LLM rewrite) run for the stale drafts with at
+    most `max_workers` calls in flight.
+    """
+    drafts = {}
+    stale = []
+    # One bulk extraction instead of a pandas row lookup per customer
+    rows = health_signals.loc[[c["id"] for c in cohort], SIGNAL_COLUMNS].to_dict("index")
+    for customer in cohort:
+        signals = rows[customer["id"]]
+        trigger = pick_trigger(signals)
+        if trigger is None:
+            continue
+
+        inputs = draft_inputs(customer, signals, trigger)
+        key = inputs_hash(inputs)
+        cached = cache.get(customer["id"])
+        if cached is not None and cached["hash"] == key:
+            drafts[customer["id"]] = cached
+            continue
+
+        draft = {"trigger": trigger, "hash": key, "text": TEMPLATES[trigger].format(**inputs)}
+        drafts[customer["id"]] = draft
+        stale.append((draft, inputs))
+
+    if personalize is not None and stale:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            texts = pool.map(lambda item: personalize(item[0]["text"], item[1]), stale)
+            for (draft, _), text in zip(stale, texts):
+                draft["text"] = text
+
+    for customer_id in set(cache) - set(drafts):
+        del cache[customer_id]
+    cache.update(drafts)
+    return drafts
+
+
+def build_queue(customers, health_signals, cache, personalize=None, max_workers=4):
+    """The outreach queue in one batch: (cohort, context, drafts).
+
+    The cohort is every customer in the CustomerRepository whose churn_risk
+    in `health_signals` (live support already applied) is in AT_RISK, in
+    repository order. `context` maps customer id -> CONTEXT_COLUMNS values and
+    `drafts` comes from generate_drafts().
+    """
+    at_risk = health_signals.index[health_signals["churn_risk"].isin(AT_RISK)]
+    cohort = [customers.get(customer_id) for customer_id in at_risk]
+    context = health_signals.loc[at_risk, CONTEXT_COLUMNS].to_dict("index")
+    drafts = generate_drafts(cohort, health_signals, cache, personalize, max_workers)
+    return cohort, context, drafts
@@ -0,0 +1,86 @@
+# test_customer_health.py
+#
+# Health scoring, churn-risk bands and the live support overlay.
+# Runs under pytest or directly with `python test_customer_health.py`.
+
+from datetime import datetime
+
+from customer_health import apply_live_support, compute_health_signals, customer_signals
+
+TODAY = datetime(2026, 1, 1)
+
+
+def make_customer(customer_id, last_7_days=100, avg_weekly=100, adopted=3, not_adopted=0,
+                  open_tickets=0, resolved=0, ai_resolved=0, escalated=0, renewal_date="2026-12-31"):
+    return {
+        "id": customer_id,
+        "health_score": 50,
+        "churn_risk": "MEDIUM",
+        "renewal_date": renewal_date,
+        "usage": {"last_7_days": last_7_days, "avg_weekly": avg_weekly, "trend": "STABLE"},
+        "features": {"adopted": ["f"] * adopted, "not_adopted": ["g"] * not_adopted},
+        "support": {
+            "open_tickets": open_tickets,
+            "resolved_this_month": resolved,
+            "ai_resolved": ai_resolved,
+            "escalated": escalated,
+        },
+    }
+
+
+def test_healthy_customer_scores_100_and_keeps_crm_values_for_comparison():
+    row = compute_health_signals([make_customer("C1")], today=TODAY).loc["C1"]
+    assert row["health_score"] == 100
+    assert row["churn_risk"] == "LOW"
+    assert row["crm_health_score"] == 50
+    assert row["crm_churn_risk"] == "MEDIUM"
+
+
+def test_components_are_weighted():
+    signals = compute_health_signals([
+        make_customer("usage", last_7_days=0),
+        make_customer("adoption", adopted=0, not_adopted=4),
+        make_customer("support", open_tickets=2, escalated=2),
+        make_customer("renewal", renewal_date="2026-01-01"),
+    ], today=TODAY)
+    assert signals["health_score"].to_dict() == {"usage": 60, "adoption": 80, "support": 75, "renewal": 85}
+
+
+def test_churn_risk_bands():
+    signals = compute_health_signals([
+        make_customer("LOW", adopted=0, not_adopted=1),
+        make_customer("MEDIUM", last_7_days=0),
+        make_customer("HIGH", last_7_days=0, adopted=0, not_adopted=1),
+        make_customer("CRITICAL", last_7_days=0, adopted=0, not_adopted=1, open_tickets=1, escalated=1),
+    ], today=TODAY)
+    assert signals["health_score"].to_dict() == {"LOW": 80, "MEDIUM": 60, "HIGH": 40, "CRITICAL": 15}
+    assert signals["churn_risk"].to_dict() == {risk: risk for risk in signals.index}
+
+
+def test_renewal_risk_follows_computed_churn_risk():
+    signals = compute_health_signals([
+        make_customer("at_risk", last_7_days=0, adopted=0, not_adopted=1, renewal_date="2026-01-20"),
+        make_customer("healthy", renewal_date="2026-01-20"),
+    ], today=TODAY)
+    assert signals["renewal_risk"].to_dict() == {"at_risk": True, "healthy": False}
+
+
+def test_live_support_rescores_only_customers_with_tickets():
+    signals = compute_health_signals([make_customer("C1"), make_customer("C2")], today=TODAY)
+    live = {"C1": {"open_tickets": 2, "solved": 0, "ai_resolved": 0, "escalated": 2}}
+
+    overlaid = apply_live_support(signals, live)
+    assert overlaid.loc["C1", "health_score"] == 75
+    assert overlaid.loc["C2", "health_score"] == 100
+    assert signals.loc["C1", "health_score"] == 100
+
+    row = customer_signals(signals, "C1", live["C1"])
+    assert row.equals(overlaid.loc["C1"])
+    assert customer_signals(signals, "C2").equals(signals.loc["C2"])
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
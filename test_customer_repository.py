@@ -0,0 +1,101 @@
+# test_customer_repository.py
+#
+# Ticket-to-customer matching rules and the live support stats built on them.
+# Runs under pytest or directly with `python test_customer_repository.py`.
+
+from customer_repository import CustomerRepository
+from dashboard_data import support_stats_by_customer
+
+
+def make_customer(customer_id, contact_email, domains=None):
+    customer = {
+        "id": customer_id,
+        "name": f"Customer {customer_id}",
+        "contact_email": contact_email,
+        "churn_risk": "LOW",
+        "renewal_date": "2026-06-01",
+    }
+    if domains is not None:
+        customer["domains"] = domains
+    return customer
+
+
+def make_ticket(ticket_id, email, status="open", escalated=False, customer_id=None):
+    ticket = {
+        "id": ticket_id,
+        "status": status,
+        "requester": {"name": "Requester", "email": email},
+        "ai_analysis": {"escalated": escalated},
+    }
+    if customer_id is not None:
+        ticket["customer_id"] = customer_id
+    return ticket
+
+
+def test_exact_email_wins_over_domain():
+    repo = CustomerRepository([
+        make_customer("C1", "ops@acme.com"),
+        make_customer("C2", "it@globex.com", domains=["globex.com", "acme.com"]),
+    ])
+    assert repo.match_email("OPS@acme.com")["id"] == "C1"
+    assert repo.match_email("dev@globex.com")["id"] == "C2"
+
+
+def test_public_mail_domain_does_not_claim_other_senders():
+    repo = CustomerRepository([make_customer("C1", "founder@gmail.com")])
+    assert repo.match_email("founder@gmail.com")["id"] == "C1"
+    assert repo.match_email("someone.else@gmail.com") is None
+
+
+def test_domain_claimed_by_two_customers_matches_neither():
+    repo = CustomerRepository([
+        make_customer("C1", "a@shared.io"),
+        make_customer("C2", "b@shared.io"),
+    ])
+    assert repo.match_email("c@shared.io") is None
+    assert repo.match_email("a@shared.io")["id"] == "C1"
+
+
+def test_explicit_domains_replace_contact_domain():
+    repo = CustomerRepository([make_customer("C1", "ops@acme-holdings.com", domains=["acme.com", "acme.co.uk"])])
+    assert repo.match_email("dev@acme.co.uk")["id"] == "C1"
+    assert repo.match_email("dev@acme-holdings.com") is None
+
+
+def test_known_customer_id_takes_priority_over_email():
+    repo = CustomerRepository([make_customer("C1", "ops@acme.com"), make_customer("C2", "it@globex.com")])
+    stats = support_stats_by_customer([make_ticket("ZD-1", "dev@acme.com", customer_id="C2")], repo)
+    assert list(stats) == ["C2"]
+
+
+def test_unknown_customer_id_falls_back_to_email():
+    repo = CustomerRepository([make_customer("C1", "ops@acme.com")])
+    stats = support_stats_by_customer([make_ticket("ZD-1", "dev@acme.com", customer_id="C404")], repo)
+    assert stats["C1"]["ticket_ids"] == ["ZD-1"]
+
+
+def test_support_stats_counts():
+    repo = CustomerRepository([make_customer("C1", "ops@acme.com"), make_customer("C2", "it@globex.com")])
+    tickets = [
+        make_ticket("ZD-1", "a@acme.com", status="open"),
+        make_ticket("ZD-2", "b@acme.com", status="open", escalated=True),
+        make_ticket("ZD-3", "c@acme.com", status="solved"),
+        make_ticket("ZD-4", "d@acme.com", status="solved", escalated=True),
+        make_ticket("ZD-5", "it@globex.com", status="solved"),
+        make_ticket("ZD-6", "stranger@gmail.com", status="open"),
+    ]
+    stats = support_stats_by_customer(tickets, repo)
+
+    assert sorted(stats) == ["C1", "C2"]
+    assert stats["C1"] == {
+        "ticket_ids": ["ZD-1", "ZD-2", "ZD-3", "ZD-4"],
+        "open_tickets": 2, "solved": 2, "ai_resolved": 1, "escalated": 2,
+    }
+    assert stats["C2"] == {"ticket_ids": ["ZD-5"], "open_tickets": 0, "solved": 1, "ai_resolved": 1, "escalated": 0}
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
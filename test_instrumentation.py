@@ -0,0 +1,76 @@
+# test_instrumentation.py
+#
+# Percentiles, the Prometheus histogram export and the response times the
+# Analytics page plots from ticket timings.
+# Runs under pytest or directly with `python test_instrumentation.py`.
+
+from dashboard_data import aggregate_tickets
+from instrumentation import Registry, percentile, stage_percentiles
+
+
+def make_ticket(ticket_id, date, timings=None, escalated=False):
+    analysis = {"confidence": 0.5, "escalated": escalated}
+    if timings is not None:
+        analysis["timings"] = timings
+    return {
+        "id": ticket_id,
+        "created_at": f"{date}T09:00:00",
+        "status": "open" if escalated else "solved",
+        "priority": "medium",
+        "device_type": "Mac",
+        "ai_analysis": analysis,
+    }
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(100, 0, -1))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 100) == 100
+    assert percentile(values, 0) == 1
+    assert percentile([7], 95) == 7
+    assert percentile([10, 20, 30, 40], 50) == 20
+
+
+def test_stage_percentiles_skips_empty_stages():
+    stats = stage_percentiles({"retrieval": [30, 10, 20], "generation": []})
+    assert stats == {"retrieval": {"count": 3, "p50": 20, "p95": 30}}
+
+
+def test_prometheus_buckets_are_cumulative():
+    registry = Registry()
+    for ms in [3, 7, 7, 40, 50000]:
+        registry.observe("retrieval", ms)
+    lines = registry.to_prometheus(metric="latency").splitlines()
+
+    buckets = {
+        line.split('le="')[1].split('"')[0]: int(line.rsplit(" ", 1)[1])
+        for line in lines if line.startswith("latency_bucket")
+    }
+    assert buckets["5"] == 1
+    assert buckets["10"] == 3
+    assert buckets["25"] == 3
+    assert buckets["50"] == 4
+    assert buckets["30000"] == 4
+    assert buckets["+Inf"] == 5
+    assert list(buckets.values()) == sorted(buckets.values())
+    assert 'latency_count{stage="retrieval"} 5' in lines
+    assert 'latency_sum{stage="retrieval"} 50057.000' in lines
+
+
+def test_response_times_only_come_from_recorded_timings():
+    stats = aggregate_tickets([
+        make_ticket("ZD-1", "2025-12-01", timings={"retrieval": 100, "generation": 900}),
+        make_ticket("ZD-2", "2025-12-01", escalated=True),
+        make_ticket("ZD-3", "2025-12-02"),
+    ])
+    assert dict(stats["response_by_date"]) == {"2025-12-01": [1000]}
+    assert dict(stats["stage_timings"]) == {"retrieval": [100], "generation": [900]}
+    assert aggregate_tickets([make_ticket("ZD-4", "2025-12-03")])["response_by_date"] == {}
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
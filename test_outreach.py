@@ -0,0 +1,108 @@
+# test_outreach.py
+#
+# Outreach trigger priority, the hash-keyed draft cache and the queue batch.
+# Runs under pytest or directly with `python test_outreach.py`.
+
+from datetime import datetime
+
+from customer_health import compute_health_signals
+from customer_repository import CustomerRepository
+from outreach import (
+    FEATURE_ADOPTION, RENEWAL_RISK, USAGE_DROP, build_queue, generate_drafts, pick_trigger
+)
+
+TODAY = datetime(2026, 1, 1)
+
+
+def make_signals(usage_drop_alert=False, renewal_risk=False, days_to_renewal=30, adoption_gap=False):
+    return {
+        "usage_drop_alert": usage_drop_alert,
+        "usage_drop_pct": 50.0,
+        "renewal_risk": renewal_risk,
+        "days_to_renewal": days_to_renewal,
+        "adoption_gap": adoption_gap,
+    }
+
+
+def make_customer(customer_id, last_7_days=0, trend="DOWN", renewal_date="2026-01-20"):
+    return {
+        "id": customer_id,
+        "name": f"Customer {customer_id}",
+        "contact_name": "Pat Lee",
+        "contact_email": f"pat@{customer_id.lower()}.com",
+        "health_score": 50,
+        "churn_risk": "MEDIUM",
+        "renewal_date": renewal_date,
+        "usage": {"last_7_days": last_7_days, "avg_weekly": 100, "trend": trend},
+        "features": {"adopted": [], "not_adopted": ["snippets"]},
+        "support": {"open_tickets": 0, "resolved_this_month": 0, "ai_resolved": 0, "escalated": 0},
+    }
+
+
+def test_pick_trigger_priority():
+    assert pick_trigger(make_signals(True, True, adoption_gap=True)) == USAGE_DROP
+    assert pick_trigger(make_signals(renewal_risk=True, adoption_gap=True)) == RENEWAL_RISK
+    assert pick_trigger(make_signals(adoption_gap=True)) == FEATURE_ADOPTION
+    assert pick_trigger(make_signals()) is None
+
+
+def test_overdue_renewal_is_not_a_renewal_trigger():
+    assert pick_trigger(make_signals(renewal_risk=True, days_to_renewal=-5)) is None
+    assert pick_trigger(make_signals(renewal_risk=True, days_to_renewal=-5, adoption_gap=True)) == FEATURE_ADOPTION
+
+
+def test_draft_reused_until_its_inputs_change():
+    customers = [make_customer("C1")]
+    cache = {}
+    rendered = []
+
+    def personalize(text, inputs):
+        rendered.append(inputs["name"])
+        return text
+
+    first = generate_drafts(customers, compute_health_signals(customers, today=TODAY), cache, personalize)
+    assert first["C1"]["trigger"] == USAGE_DROP
+
+    # A field the usage-drop template doesn't read leaves the hash alone
+    customers[0]["renewal_date"] = "2026-03-01"
+    hit = generate_drafts(customers, compute_health_signals(customers, today=TODAY), cache, personalize)
+    assert hit["C1"] is first["C1"]
+    assert rendered == ["Customer C1"]
+
+    customers[0]["usage"]["last_7_days"] = 10
+    miss = generate_drafts(customers, compute_health_signals(customers, today=TODAY), cache, personalize)
+    assert miss["C1"]["hash"] != first["C1"]["hash"]
+    assert "from 100h to 10h" in miss["C1"]["text"]
+    assert rendered == ["Customer C1", "Customer C1"]
+
+
+def test_cache_drops_customers_that_left_the_cohort():
+    customers = [make_customer("C1"), make_customer("C2")]
+    cache = {}
+    generate_drafts(customers, compute_health_signals(customers, today=TODAY), cache)
+    assert sorted(cache) == ["C1", "C2"]
+
+    generate_drafts(customers[1:], compute_health_signals(customers, today=TODAY), cache)
+    assert sorted(cache) == ["C2"]
+
+
+def test_build_queue_selects_computed_at_risk_customers():
+    customers = [
+        make_customer("C1"),
+        make_customer("C2", last_7_days=100, trend="STABLE", renewal_date="2026-12-31"),
+    ]
+    cache = {}
+    cohort, context, drafts = build_queue(
+        CustomerRepository(customers), compute_health_signals(customers, today=TODAY), cache
+    )
+    assert [c["id"] for c in cohort] == ["C1"]
+    assert context["C1"]["churn_risk"] in ("HIGH", "CRITICAL")
+    assert context["C1"]["days_to_renewal"] == 19
+    assert sorted(drafts) == sorted(cache) == ["C1"]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,246 @@
+# test_performance.py
+#
+# Times the TAM dashboard data prep against synthetic stores at 1k/10k/100k.
+#
+#   python test_performance.py                  # run and compare to baseline
+#   python test_performance.py --save-baseline  # record a new local baseline
+#   python test_performance.py --sizes 1000     # only the smallest scale
+
+import argparse
+import json
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from customer_health import AT_RISK, apply_live_support, compute_health_signals, customer_signals
+from customer_repository import CustomerRepository
+from dashboard_data import (
+    aggregate_tickets, filter_tickets, store_version, summarize_notifications, summarize_tickets,
+    support_stats_by_customer
+)
+from outreach import build_queue, generate_drafts
+
+BASELINE_FILE = Path(__file__).parent / "perf_baseline.json"
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+DEVICES = ["Mac", "Windows", "iOS"]
+PRIORITIES = ["urgent", "high", "medium", "low"]
+CHANNELS = ["#cs-billing", "#cs-privacy", "#cs-tech-mac", "#cs-tech-windows", "#cs-tech-ios"]
+TEAMS = ["billing", "privacy", "tech_mac", "tech_windows", "tech_ios"]
+RISKS = ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
+
+
+# ============================================================================
+# SYNTHETIC DATA
+# ============================================================================
+
+def make_customers(n, rng):
+    today = datetime.now()
+    customers = []
+    for i in range(n):
+        avg_weekly = rng.randint(20, 400)
+        customers.append({
+            "id": f"CUST-{i:06d}",
+            "name": f"Customer {i}",
+            "contact_name": f"Contact {i}",
+            "contact_email": f"contact{i}@customer{i}.com",
+            "contract_value": rng.randint(5, 500) * 1000,
+            "renewal_date": (today + timedelta(days=rng.randint(-30, 365))).strftime("%Y-%m-%d"),
+            "health_score": rng.randint(10, 100),
+            "churn_risk": rng.choice(RISKS),
+            "usage": {
+                "last_7_days": rng.randint(0, avg_weekly * 2),
+                "avg_weekly": avg_weekly,
+                "trend": rng.choice(["UP", "STABLE", "DOWN"]),
+                "last_active": (today - timedelta(days=rng.randint(0, 30))).strftime("%Y-%m-%d"),
+            },
+            "features": {
+                "adopted": ["dictation", "commands"],
+                "not_adopted": rng.sample(["snippets", "styles", "whisper_mode"], rng.randint(0, 3)),
+            },
+            "support": {
+                "open_tickets": rng.randint(0, 5),
+                "resolved_this_month": rng.randint(0, 10),
+                "ai_resolved": rng.randint(0, 5),
+                "escalated": rng.randint(0, 3),
+                "avg_response_time_ms": rng.randint(0, 10000),
+            },
+        })
+    return customers
+
+
+def make_tickets(n, rng, customers):
+    start = datetime.now() - timedelta(days=90)
+    tickets = []
+    for i in range(n):
+        customer = customers[i % len(customers)]
+        domain = customer["contact_email"].split("@")[1]
+        created = start + timedelta(minutes=i * 90 * 24 * 60 // n)
+        escalated = rng.random() < 0.35
+        tickets.append({
+            "id": f"ZD-{1001 + i}",
+            "subject": f"Synthetic issue {i}",
+            "description": "Transcription stops midway through dictation.",
+            "status": "open" if escalated or rng.random() < 0.2 else "solved",
+            "priority": rng.choice(PRIORITIES),
+            "device_type": rng.choice(DEVICES),
+            "requester": {"name": f"User {i}", "email": f"user{i}@{domain}"},
+            "created_at": created.isoformat(),
+            "updated_at": created.isoformat(),
+            "ai_analysis": {
+                "confidence": round(rng.random(), 4),
+                "escalated": escalated,
+                "team": rng.choice(TEAMS),
+                "response": "Based on the provided documentation...",
+            },
+        })
+    return tickets
+
+
+def make_notifications(n, rng):
+    start = datetime.now() - timedelta(days=90)
+    notifications = []
+    for i in range(n):
+        notifications.append({
+            "id": f"NOTIF-{i + 1}",
+            "channel": rng.choice(CHANNELS),
+            "priority": rng.choice(PRIORITIES),
+            "timestamp": (start + timedelta(minutes=i)).isoformat(),
+            "read": rng.random() < 0.7,
+            "message": {
+                "title": "🎫 New HIGH Priority Ticket",
+                "customer": f"User {i}",
+                "ticket_id": f"ZD-{1001 + i}",
+                "ai_confidence": round(rng.random(), 4),
+            },
+        })
+    return notifications
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def cached_by_version(build):
+    """Stand-in for the dashboard's st.cache_resource(max_entries=1): build(version) runs once per version."""
+    cache = {}
+
+    def get(version):
+        if version not in cache:
+            cache.clear()
+            cache[version] = build(version)
+        return cache[version]
+    return get
+
+
+def benchmarks(customers, tickets, notifications):
+    """Name -> zero-arg callable for each piece of page data prep."""
+    repo = CustomerRepository(customers)
+    last_name = customers[-1]["name"]
+    last_id = customers[-1]["id"]
+    signals = compute_health_signals(customers)
+    live_stats = support_stats_by_customer(tickets, repo)
+    at_risk = [repo.get(cid) for cid in signals.index[signals["churn_risk"].isin(AT_RISK)]]
+    warm_drafts = {}
+    generate_drafts(at_risk, signals, warm_drafts)
+
+    # The per-rerun paths of Customer Health and Proactive Outreach, with the
+    # same version-keyed caching dashboard_tam.py uses
+    load_live_support = cached_by_version(lambda version: support_stats_by_customer(tickets, repo))
+    load_outreach_queue = cached_by_version(
+        lambda version: build_queue(repo, apply_live_support(signals, load_live_support(version)), {})
+    )
+
+    def customer_health_page():
+        live = load_live_support(store_version(tickets))
+        return customer_signals(signals, last_id, live.get(last_id))
+
+    def outreach_page():
+        return load_outreach_queue(store_version(tickets))
+
+    return {
+        "customers.index_build": lambda: CustomerRepository(customers),
+        "customer_health.lookup": lambda: repo.by_name(last_name),
+        "customer_health.signals": lambda: compute_health_signals(customers),
+        "customer_health.ticket_join": lambda: support_stats_by_customer(tickets, repo),
+        "customer_health.page_prep": customer_health_page,
+        "customers.renewing_45_days": lambda: repo.renewing_within(45),
+        "outreach.at_risk_crm": lambda: repo.with_churn_risk("HIGH", "CRITICAL"),
+        "outreach.drafts_cold": lambda: generate_drafts(at_risk, signals, {}),
+        "outreach.drafts_warm": lambda: generate_drafts(at_risk, signals, warm_drafts),
+        "outreach.queue_rebuild": lambda: build_queue(repo, apply_live_support(signals, live_stats), warm_drafts),
+        "outreach.page_prep": outreach_page,
+        "support_tickets.summary": lambda: summarize_tickets(tickets),
+        "support_tickets.filter_all": lambda: filter_tickets(tickets),
+        "support_tickets.filter_combined": lambda: filter_tickets(tickets, "open", "high", "Mac"),
+        "analytics.aggregate": lambda: aggregate_tickets(tickets),
+        "slack.summary": lambda: summarize_notifications(notifications),
+    }
+
+
+def best_of(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000
+
+
+def run(sizes, repeat, seed):
+    results = {}
+    for size in sizes:
+        rng = random.Random(seed)
+        customers = make_customers(max(1, size // 10), rng)
+        tickets = make_tickets(size, rng, customers)
+        notifications = make_notifications(size, rng)
+
+        print(f"📦 {size:,} tickets / {size:,} notifications / {len(customers):,} customers")
+        for name, fn in benchmarks(customers, tickets, notifications).items():
+            key = f"{name}@{size}"
+            results[key] = best_of(fn, repeat)
+            print(f"   {name:<32} {results[key]:9.2f} ms")
+        print()
+    return results
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for key, ms in results.items():
+        if key not in baseline:
+            continue
+        # Ignore sub-millisecond noise
+        if ms > baseline[key] * tolerance and ms - baseline[key] > 1.0:
+            regressions.append((key, baseline[key], ms))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark TAM dashboard data prep")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--tolerance", type=float, default=1.5,
+                        help="fail when a timing exceeds baseline x tolerance")
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    print("\n⏱️  DASHBOARD DATA PREP BENCHMARKS\n")
+    results = run(args.sizes, args.repeat, args.seed)
+
+    if args.save_baseline:
+        baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+        baseline.update(results)
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2, sort_keys=True))
+        print(f"💾 Saved baseline to {BASELINE_FILE.name}")
+        sys.exit(0)
+
+    if not BASELINE_FILE.exists():
+        print("⚠️  No baseline yet. Run with --save-baseline to record one.")
+        sys.exit(0)
+
+    regressions = compare(results, json.loads(BASELINE_FILE.read_text()), args.tolerance)
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) vs baseline:")
+        for key, before, after in regressions:
+            print(f"   {key}: {before:.2f} ms → {after:.2f} ms")
+        sys.exit(1)
+
+    print("✅ No regressions vs baseline")
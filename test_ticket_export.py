@@ -0,0 +1,137 @@
+# test_ticket_export.py
+#
+# Round-trip checks for the Parquet export: incremental, --full and removal.
+# Runs under pytest or directly with `python test_ticket_export.py`.
+
+import tempfile
+from pathlib import Path
+
+import ticket_export
+
+
+def make_ticket(ticket_id, created_at, status="solved", escalated=False, confidence=0.5):
+    return {
+        "id": ticket_id,
+        "created_at": created_at,
+        "status": status,
+        "priority": "medium",
+        "device_type": "Mac",
+        "requester": {"name": "Sarah Chen", "email": "sarah@designco.com"},
+        "ai_analysis": {"confidence": confidence, "escalated": escalated, "team": "tech_mac"},
+    }
+
+
+def day_dirs(out_dir):
+    return sorted(p.name for p in (Path(out_dir) / "tickets").glob("date=*"))
+
+
+def exported_ids(out_dir):
+    return sorted(ticket_export.load("tickets", out_dir)["id"])
+
+
+def test_incremental_export_rewrites_only_changed_days():
+    with tempfile.TemporaryDirectory() as out:
+        tickets = [
+            make_ticket("ZD-1", "2025-12-01T09:00:00"),
+            make_ticket("ZD-2", "2025-12-02T09:00:00"),
+        ]
+        assert ticket_export.export_all(out, tickets=tickets, notifications=[])["tickets"] == (2, 0, 0)
+        assert ticket_export.export_all(out, tickets=tickets, notifications=[])["tickets"] == (0, 2, 0)
+
+        tickets[1]["status"] = "open"
+        assert ticket_export.export_all(out, tickets=tickets, notifications=[])["tickets"] == (1, 1, 0)
+        loaded = ticket_export.load("tickets", out)
+        assert loaded.set_index("id").loc["ZD-2", "status"] == "open"
+
+
+def test_incremental_export_removes_days_without_records():
+    with tempfile.TemporaryDirectory() as out:
+        tickets = [
+            make_ticket("ZD-1", "2025-12-01T09:00:00"),
+            make_ticket("ZD-2", "2025-12-02T09:00:00"),
+        ]
+        ticket_export.export_all(out, tickets=tickets, notifications=[])
+
+        assert ticket_export.export_all(out, tickets=tickets[1:], notifications=[])["tickets"] == (0, 1, 1)
+        assert day_dirs(out) == ["date=2025-12-02"]
+        assert exported_ids(out) == ["ZD-2"]
+
+
+def test_full_export_removes_days_without_records():
+    with tempfile.TemporaryDirectory() as out:
+        tickets = [
+            make_ticket("ZD-1", "2025-12-01T09:00:00"),
+            make_ticket("ZD-2", "2025-12-02T09:00:00"),
+        ]
+        ticket_export.export_all(out, tickets=tickets, notifications=[])
+
+        assert ticket_export.export_all(out, full=True, tickets=tickets[1:], notifications=[])["tickets"] == (1, 0, 1)
+        assert day_dirs(out) == ["date=2025-12-02"]
+        assert exported_ids(out) == ["ZD-2"]
+
+        # A later incremental run still sees a consistent manifest and disk
+        assert ticket_export.export_all(out, tickets=tickets[1:], notifications=[])["tickets"] == (0, 1, 0)
+        assert exported_ids(out) == ["ZD-2"]
+
+
+def test_incremental_export_removes_days_missing_from_manifest():
+    with tempfile.TemporaryDirectory() as out:
+        tickets = [
+            make_ticket("ZD-1", "2025-12-01T09:00:00"),
+            make_ticket("ZD-2", "2025-12-02T09:00:00"),
+        ]
+        ticket_export.export_all(out, tickets=tickets, notifications=[])
+        (Path(out) / ticket_export.MANIFEST).unlink()
+
+        ticket_export.export_all(out, tickets=tickets[1:], notifications=[])
+        assert day_dirs(out) == ["date=2025-12-02"]
+        assert exported_ids(out) == ["ZD-2"]
+
+
+def test_confidence_report_keeps_unscored_tickets_out_of_lowest_bucket():
+    with tempfile.TemporaryDirectory() as out:
+        tickets = [
+            make_ticket("ZD-1", "2025-12-01T09:00:00", confidence=0.05),
+            make_ticket("ZD-2", "2025-12-01T10:00:00", confidence=None, escalated=True),
+            make_ticket("ZD-3", "2025-12-01T11:00:00", confidence=None),
+            make_ticket("ZD-4", "2025-12-01T12:00:00", confidence=0.95, escalated=True),
+        ]
+        ticket_export.export_all(out, tickets=tickets, notifications=[])
+        report = ticket_export.confidence_report(ticket_export.load("tickets", out))
+
+        assert report.iloc[0].tolist() == [1, 0]
+        assert report.loc["(0.9, 1.0]"].tolist() == [0, 1]
+        assert report.loc["no confidence"].tolist() == [1, 1]
+        assert "out of range" not in report.index
+        assert report.to_numpy().sum() == len(tickets)
+
+
+def test_confidence_report_counts_out_of_range_confidences_separately():
+    with tempfile.TemporaryDirectory() as out:
+        tickets = [
+            make_ticket("ZD-1", "2025-12-01T09:00:00", confidence=1.2, escalated=True),
+            make_ticket("ZD-2", "2025-12-01T10:00:00", confidence=-0.1),
+            make_ticket("ZD-3", "2025-12-01T11:00:00", confidence=0.0),
+            make_ticket("ZD-4", "2025-12-01T12:00:00", confidence=1.0),
+        ]
+        ticket_export.export_all(out, tickets=tickets, notifications=[])
+        report = ticket_export.confidence_report(ticket_export.load("tickets", out))
+
+        assert report.loc["out of range"].tolist() == [1, 1]
+        assert report.iloc[0].tolist() == [1, 0]
+        assert report.loc["(0.9, 1.0]"].tolist() == [1, 0]
+        assert report.to_numpy().sum() == len(tickets)
+
+
+def test_retrieved_docs_are_exported_as_source_page_ids():
+    ticket = make_ticket("ZD-1", "2025-12-01T09:00:00")
+    ticket["ai_analysis"]["retrieved_docs"] = [{"source": "setup.pdf", "page": 3}, {"source": "faq.pdf", "page": 1}]
+    assert ticket_export.flatten_ticket(ticket)["retrieved_doc_ids"] == ["setup.pdf#3", "faq.pdf#1"]
+    assert ticket_export.flatten_ticket(make_ticket("ZD-2", "2025-12-01T09:00:00"))["retrieved_doc_ids"] == []
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
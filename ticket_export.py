@@ -0,0 +1,236 @@
+# ticket_export.py
+#
+# Columnar snapshots of tickets and Slack notifications for offline analytics.
+#
+#   python ticket_export.py export                 # incremental: rewrite changed days only
+#   python ticket_export.py export --full          # rebuild every partition
+#   python ticket_export.py report monthly         # AI resolution / escalation by month
+#   python ticket_export.py report teams --start 2025-12-01
+#   python ticket_export.py report confidence
+#
+# Records are flattened and written as Parquet partitioned by day
+# (<out>/<dataset>/date=YYYY-MM-DD/part-0.parquet). A manifest of per-day
+# content hashes lets incremental runs skip days whose records didn't change.
+# The agent records the chunks it retrieved for a ticket as
+# ai_analysis["retrieved_docs"] = [{"source": ..., "page": ...}] (the
+# DocumentChunk fields), which are exported as "source#page" ids.
+
+import argparse
+import hashlib
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+DEFAULT_OUT = Path(__file__).parent / "data" / "exports"
+MANIFEST = "_manifest.json"
+DATASETS = ["tickets", "notifications"]
+
+
+# ============================================================================
+# FLATTENING
+# ============================================================================
+
+def _doc_ids(analysis):
+    """Retrieved document ids as "source#page" strings."""
+    return [f"{doc.get('source', '?')}#{doc.get('page', '?')}" for doc in analysis.get("retrieved_docs", [])]
+
+
+def flatten_ticket(ticket):
+    analysis = ticket.get("ai_analysis", {})
+    requester = ticket.get("requester", {})
+    return {
+        "id": ticket["id"],
+        "date": ticket["created_at"][:10],
+        "created_at": ticket["created_at"],
+        "updated_at": ticket.get("updated_at"),
+        "status": ticket["status"],
+        "priority": ticket.get("priority"),
+        "device_type": ticket.get("device_type"),
+        "subject": ticket.get("subject"),
+        "requester_name": requester.get("name"),
+        "requester_email": requester.get("email"),
+        "confidence": analysis.get("confidence"),
+        "escalated": bool(analysis.get("escalated")),
+        "team": analysis.get("team"),
+        "retrieved_doc_ids": _doc_ids(analysis),
+    }
+
+
+def flatten_notification(notif):
+    msg = notif.get("message", {})
+    return {
+        "id": notif["id"],
+        "date": notif["timestamp"][:10],
+        "timestamp": notif["timestamp"],
+        "channel": notif.get("channel"),
+        "priority": notif.get("priority"),
+        "read": bool(notif.get("read")),
+        "ticket_id": msg.get("ticket_id"),
+        "customer": msg.get("customer"),
+        "ai_confidence": msg.get("ai_confidence"),
+    }
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+def _partition_hash(rows):
+    payload = json.dumps(sorted(rows, key=lambda r: r["id"]), sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def export_dataset(rows, dataset_dir, manifest, full=False):
+    """Write one Parquet file per day; return (written, skipped, removed) day counts."""
+    by_date = {}
+    for row in rows:
+        by_date.setdefault(row["date"], []).append(row)
+
+    # Stale days are found on disk, not in the manifest, which may be empty or out of date
+    on_disk = {p.name[len("date="):] for p in dataset_dir.glob("date=*")} if dataset_dir.exists() else set()
+    stale_days = sorted((on_disk | set(manifest)) - set(by_date))
+
+    if full:
+        shutil.rmtree(dataset_dir, ignore_errors=True)
+        manifest.clear()
+
+    written = skipped = 0
+    for date, day_rows in sorted(by_date.items()):
+        digest = _partition_hash(day_rows)
+        part_dir = dataset_dir / f"date={date}"
+        if not full and manifest.get(date) == digest and part_dir.exists():
+            skipped += 1
+            continue
+        part_dir.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame(day_rows).drop(columns=["date"]).to_parquet(part_dir / "part-0.parquet", index=False)
+        manifest[date] = digest
+        written += 1
+
+    # Days that no longer hold any records (e.g. after retention) are dropped
+    for date in stale_days:
+        shutil.rmtree(dataset_dir / f"date={date}", ignore_errors=True)
+        manifest.pop(date, None)
+    return written, skipped, len(stale_days)
+
+
+def export_all(out_dir=DEFAULT_OUT, full=False, tickets=None, notifications=None):
+    """Export both datasets; stores are read through their public APIs unless records are passed in."""
+    if tickets is None or notifications is None:
+        from src.integrations.local_ticketing import LocalTicketSystem
+        from src.integrations.local_slack import LocalSlackSimulator
+        tickets = LocalTicketSystem().get_all_tickets() if tickets is None else tickets
+        notifications = LocalSlackSimulator().get_all_notifications() if notifications is None else notifications
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST
+    manifest = {} if full or not manifest_path.exists() else json.loads(manifest_path.read_text())
+
+    results = {}
+    for dataset, records, flatten in [
+        ("tickets", tickets, flatten_ticket),
+        ("notifications", notifications, flatten_notification),
+    ]:
+        rows = [flatten(r) for r in records]
+        results[dataset] = export_dataset(rows, out_dir / dataset, manifest.setdefault(dataset, {}), full)
+
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    return results
+
+
+# ============================================================================
+# QUERY
+# ============================================================================
+
+def load(dataset, out_dir=DEFAULT_OUT, start=None, end=None, columns=None):
+    """Read a dataset for days in [start, end] (YYYY-MM-DD strings), reading only those partitions."""
+    frames = []
+    for part_dir in sorted((Path(out_dir) / dataset).glob("date=*")):
+        date = part_dir.name[len("date="):]
+        if (start and date < start) or (end and date > end):
+            continue
+        frame = pd.read_parquet(part_dir / "part-0.parquet", columns=columns)
+        frame["date"] = date
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=(columns or []) + ["date"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def monthly_report(tickets):
+    """Month-over-month volume, AI resolution rate and escalation rate."""
+    df = tickets.assign(
+        month=tickets["date"].str[:7],
+        ai_resolved=(tickets["status"] == "solved") & ~tickets["escalated"],
+    )
+    report = df.groupby("month").agg(
+        tickets=("id", "count"), ai_resolved=("ai_resolved", "sum"), escalated=("escalated", "sum")
+    )
+    report["ai_resolution_rate"] = report["ai_resolved"] / report["tickets"] * 100
+    report["escalation_rate"] = report["escalated"] / report["tickets"] * 100
+    return report
+
+
+def team_report(tickets):
+    """Volume, escalation rate and average confidence per team."""
+    report = tickets.groupby(tickets["team"].fillna("N/A")).agg(
+        tickets=("id", "count"), escalated=("escalated", "sum"), avg_confidence=("confidence", "mean")
+    )
+    report["escalation_rate"] = report["escalated"] / report["tickets"] * 100
+    return report.sort_values("tickets", ascending=False)
+
+
+def confidence_report(tickets, bins=10):
+    """Ticket counts per AI confidence bucket, split by escalation.
+
+    Tickets without a confidence, or with one outside [0, 1], get their own
+    "no confidence" / "out of range" rows so every ticket is counted once.
+    """
+    confidence = pd.to_numeric(tickets["confidence"], errors="coerce")
+    buckets = pd.cut(confidence, bins=[i / bins for i in range(bins + 1)], include_lowest=True)
+    report = tickets.groupby([buckets, "escalated"], observed=False)["id"].count().unstack(fill_value=0)
+    report = report.reindex(columns=[False, True], fill_value=0)
+    report.index = report.index.astype(str)
+    for label, mask in [("no confidence", confidence.isna()), ("out of range", ~confidence.isna() & buckets.isna())]:
+        if mask.any():
+            report.loc[label] = tickets.loc[mask, "escalated"].value_counts().reindex([False, True], fill_value=0)
+    return report
+
+
+REPORTS = {
+    "monthly": (monthly_report, ["id", "status", "escalated"]),
+    "teams": (team_report, ["id", "team", "escalated", "confidence"]),
+    "confidence": (confidence_report, ["id", "confidence", "escalated"]),
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export tickets/notifications to Parquet and run reports")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export_cmd = sub.add_parser("export", help="write day-partitioned Parquet snapshots")
+    export_cmd.add_argument("--full", action="store_true", help="rewrite every partition")
+
+    report_cmd = sub.add_parser("report", help="run a report over the exported tickets")
+    report_cmd.add_argument("name", choices=sorted(REPORTS))
+    report_cmd.add_argument("--start", help="first day (YYYY-MM-DD)")
+    report_cmd.add_argument("--end", help="last day (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        for dataset, (written, skipped, removed) in export_all(args.out, args.full).items():
+            print(f"✅ {dataset}: {written} days written, {skipped} unchanged, {removed} removed")
+    else:
+        report, columns = REPORTS[args.name]
+        tickets = load("tickets", args.out, args.start, args.end, columns=columns)
+        if tickets.empty:
+            print("📭 No exported tickets in range. Run `python ticket_export.py export` first.")
+            sys.exit(1)
+        print(report(tickets).to_string())